@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -75,6 +76,19 @@ TEMPLATES = [
     },
 ]
 
+# Template caching for production
+# With the cached loader each template is parsed once per process instead of
+# on every render() call. Only enabled when DEBUG is off so templates still
+# auto-reload during development.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'LibraryProject.wsgi.application'
 
 
@@ -107,6 +121,13 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Under the test runner, hash passwords with MD5 instead of PBKDF2. The
+# default hasher deliberately burns ~100ms per set_password call, which
+# dominates test runtime for every created user; test data doesn't need
+# production-grade hashes.
+if 'test' in sys.argv:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -1,8 +1,17 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from .models import Book, CustomUser
 
+# Book permissions that grant access to the Book admin module
+_BOOK_PERMS = frozenset({
+    'bookshelf.can_view',
+    'bookshelf.can_create',
+    'bookshelf.can_edit',
+    'bookshelf.can_delete',
+})
+
 
 class CustomUserCreationForm(UserCreationForm):
     """Custom user creation form for the admin interface."""
@@ -20,6 +29,16 @@ class CustomUserChangeForm(UserChangeForm):
         fields = ('email', 'first_name', 'last_name', 'date_of_birth', 'profile_photo')
 
 
+class CustomUserChangeList(ChangeList):
+    """Changelist that fetches only the columns the list view renders,
+    skipping wide fields like password and profile_photo."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        return super().get_queryset(request, *args, **kwargs).only(
+            'email', 'first_name', 'last_name', 'is_staff', 'is_active', 'date_joined',
+        )
+
+
 class CustomUserAdmin(UserAdmin):
     """Custom user admin configuration."""
     
@@ -55,6 +74,12 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        """Use the projected changelist for the list view only; the change
+        view still loads full rows, so editing a user doesn't pay one
+        deferred-field query per form field."""
+        return CustomUserChangeList
+
 
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
@@ -65,13 +90,11 @@ class BookAdmin(admin.ModelAdmin):
     
     def has_module_permission(self, request):
         """Allow access to the Book admin if user has any book permission."""
-        return (
-            request.user.has_perm('bookshelf.can_view') or
-            request.user.has_perm('bookshelf.can_create') or
-            request.user.has_perm('bookshelf.can_edit') or
-            request.user.has_perm('bookshelf.can_delete') or
-            super().has_module_permission(request)
-        )
+        # get_all_permissions is cached on the user, so one set intersection
+        # replaces four sequential has_perm backend traversals
+        if request.user.get_all_permissions() & _BOOK_PERMS:
+            return True
+        return super().has_module_permission(request)
 
 
 # Register the custom user model with the custom admin
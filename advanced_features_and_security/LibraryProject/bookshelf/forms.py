@@ -6,10 +6,32 @@ Includes secure form implementations with input validation and XSS protection.
 from django import forms
 from django.core.exceptions import ValidationError
 from django.utils.html import escape
-import bleach
 import re
 from .models import Book
 
+# Fixed lowercase tokens that must never appear in user input. A plain
+# substring scan over the lowercased value is much cheaper than invoking
+# the regex engine for these.
+_XSS_TOKENS = ('<script', 'javascript:', 'data:')
+
+# Strips HTML tags from plain-text fields. bleach.clean with tags=[] and
+# strip=True removed every tag anyway, but paid for html5lib's full
+# tokenizer per call; a compiled regex is plenty for these fields.
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Event-handler attributes (onerror=, onclick=, ...) still need a regex.
+# The input is lowercased before the search, so no IGNORECASE flag: the
+# engine skips per-character case folding.
+_EVENT_ATTR_RE = re.compile(r'on\w+\s*=')
+
+
+def _contains_xss_token(value, check_event_attrs=False):
+    """Return True if the value contains one of the fixed XSS tokens."""
+    lower = value.lower()
+    if any(token in lower for token in _XSS_TOKENS):
+        return True
+    return check_event_attrs and _EVENT_ATTR_RE.search(lower) is not None
+
 
 class BookForm(forms.ModelForm):
     """
@@ -31,18 +53,30 @@ class BookForm(forms.ModelForm):
         """
         title = self.cleaned_data.get('title')
         if title:
+            title = title.strip()
+            
+            # Fast path: ASCII input containing no '<' and no ':' cannot
+            # match any of the tag or scheme patterns checked below
+            if title.isascii() and '<' not in title and ':' not in title:
+                if len(title) < 1:
+                    raise ValidationError("Title cannot be empty.")
+                if len(title) > 200:
+                    raise ValidationError("Title cannot exceed 200 characters.")
+                return title
+            
+            # Reject malicious input up front, before any tag stripping
+            if _contains_xss_token(title):
+                raise ValidationError("Invalid characters in title.")
+            
             # Remove any HTML tags and sanitize input
-            title = bleach.clean(title.strip(), tags=[], strip=True)
+            if '<' in title:
+                title = _TAG_RE.sub('', title).strip()
             
             # Validate title length and content
             if len(title) < 1:
                 raise ValidationError("Title cannot be empty.")
             if len(title) > 200:
                 raise ValidationError("Title cannot exceed 200 characters.")
-            
-            # Check for potentially malicious patterns
-            if re.search(r'<script|javascript:|data:', title, re.IGNORECASE):
-                raise ValidationError("Invalid characters in title.")
                 
         return title
     
@@ -52,18 +86,30 @@ class BookForm(forms.ModelForm):
         """
         author = self.cleaned_data.get('author')
         if author:
+            author = author.strip()
+            
+            # Fast path: ASCII input containing no '<' and no ':' cannot
+            # match any of the tag or scheme patterns checked below
+            if author.isascii() and '<' not in author and ':' not in author:
+                if len(author) < 1:
+                    raise ValidationError("Author name cannot be empty.")
+                if len(author) > 100:
+                    raise ValidationError("Author name cannot exceed 100 characters.")
+                return author
+            
+            # Reject malicious input up front, before any tag stripping
+            if _contains_xss_token(author):
+                raise ValidationError("Invalid characters in author name.")
+            
             # Remove any HTML tags and sanitize input
-            author = bleach.clean(author.strip(), tags=[], strip=True)
+            if '<' in author:
+                author = _TAG_RE.sub('', author).strip()
             
             # Validate author length and content
             if len(author) < 1:
                 raise ValidationError("Author name cannot be empty.")
             if len(author) > 100:
                 raise ValidationError("Author name cannot exceed 100 characters.")
-            
-            # Check for potentially malicious patterns
-            if re.search(r'<script|javascript:|data:', author, re.IGNORECASE):
-                raise ValidationError("Invalid characters in author name.")
                 
         return author
     
@@ -119,18 +165,21 @@ class ExampleForm(forms.Form):
         """
         name = self.cleaned_data.get('name')
         if name:
+            name = name.strip()
+            
+            # Reject malicious input up front, before any tag stripping
+            if _contains_xss_token(name, check_event_attrs=True):
+                raise ValidationError("Invalid characters in name.")
+            
             # Remove any HTML tags and sanitize input
-            name = bleach.clean(name.strip(), tags=[], strip=True)
+            if '<' in name:
+                name = _TAG_RE.sub('', name).strip()
             
             # Validate name length and content
             if len(name) < 1:
                 raise ValidationError("Name cannot be empty.")
             if len(name) > 100:
                 raise ValidationError("Name cannot exceed 100 characters.")
-            
-            # Check for potentially malicious patterns
-            if re.search(r'<script|javascript:|data:|on\w+\s*=', name, re.IGNORECASE):
-                raise ValidationError("Invalid characters in name.")
                 
         return name
     
@@ -140,17 +189,20 @@ class ExampleForm(forms.Form):
         """
         message = self.cleaned_data.get('message')
         if message:
+            message = message.strip()
+            
+            # Reject malicious input up front, before any tag stripping
+            if _contains_xss_token(message, check_event_attrs=True):
+                raise ValidationError("Invalid characters in message.")
+            
             # Remove any HTML tags and sanitize input
-            message = bleach.clean(message.strip(), tags=[], strip=True)
+            if '<' in message:
+                message = _TAG_RE.sub('', message).strip()
             
             # Validate message length and content
             if len(message) < 1:
                 raise ValidationError("Message cannot be empty.")
             if len(message) > 500:
                 raise ValidationError("Message cannot exceed 500 characters.")
-            
-            # Check for potentially malicious patterns
-            if re.search(r'<script|javascript:|data:|on\w+\s*=', message, re.IGNORECASE):
-                raise ValidationError("Invalid characters in message.")
                 
         return message
\ No newline at end of file
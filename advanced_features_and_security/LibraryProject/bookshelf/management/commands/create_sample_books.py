@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from bookshelf.models import Book
 
 
@@ -6,6 +7,12 @@ class Command(BaseCommand):
     help = 'Create sample books for testing permissions'
 
     def handle(self, *args, **options):
+        # Bind the output helpers once instead of re-resolving the
+        # attribute chain on every write
+        write = self.stdout.write
+        success = self.style.SUCCESS
+        warning = self.style.WARNING
+
         sample_books = [
             {
                 'title': 'Django Security Best Practices',
@@ -29,23 +36,30 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
-        for book_data in sample_books:
-            book, created = Book.objects.get_or_create(
-                title=book_data['title'],
-                defaults=book_data
+        # One SELECT for the existing titles, one bulk INSERT for the rest,
+        # instead of a SELECT + INSERT round-trip per book
+        titles = [book_data['title'] for book_data in sample_books]
+        with transaction.atomic():
+            existing_titles = set(
+                Book.objects.filter(title__in=titles).values_list('title', flat=True)
             )
-            
-            if created:
-                created_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f'Created book: {book.title}')
+            new_books = [
+                Book(**book_data)
+                for book_data in sample_books
+                if book_data['title'] not in existing_titles
+            ]
+            Book.objects.bulk_create(new_books, ignore_conflicts=True)
+
+        for book_data in sample_books:
+            if book_data['title'] in existing_titles:
+                write(
+                    warning(f'Book already exists: {book_data["title"]}')
                 )
             else:
-                self.stdout.write(
-                    self.style.WARNING(f'Book already exists: {book.title}')
+                write(
+                    success(f'Created book: {book_data["title"]}')
                 )
 
-        self.stdout.write(
-            self.style.SUCCESS(f'\nCreated {created_count} new books. Total books: {Book.objects.count()}')
+        write(
+            success(f'\nCreated {len(new_books)} new books. Total books: {Book.objects.count()}')
         )
\ No newline at end of file
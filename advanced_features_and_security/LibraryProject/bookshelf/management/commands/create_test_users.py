@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import Group
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 
 User = get_user_model()
 
@@ -9,13 +11,19 @@ class Command(BaseCommand):
     help = 'Create test users and assign them to different groups'
 
     def handle(self, *args, **options):
+        # Bind the output helpers once instead of re-resolving the
+        # attribute chain on every write
+        write = self.stdout.write
+        success = self.style.SUCCESS
+        warning = self.style.WARNING
+
         # Get the groups
         try:
             viewers_group = Group.objects.get(name='Viewers')
             editors_group = Group.objects.get(name='Editors')
             admins_group = Group.objects.get(name='Admins')
         except Group.DoesNotExist:
-            self.stdout.write(
+            write(
                 self.style.ERROR('Groups not found. Please run setup_groups command first.')
             )
             return
@@ -45,42 +53,77 @@ class Command(BaseCommand):
             },
         ]
 
+        emails = [user_data['email'] for user_data in test_users]
+
+        # All test users share the same password, so run the (deliberately
+        # slow) password hasher once and reuse the hash
+        hashed_password = make_password('testpass123')
+
+        with transaction.atomic():
+            # One SELECT for the users that already exist, then one bulk
+            # INSERT for the rest, instead of get_or_create + save per user
+            existing_emails = set(
+                User.objects.filter(email__in=emails).values_list('email', flat=True)
+            )
+            User.objects.bulk_create([
+                User(
+                    email=user_data['email'],
+                    first_name=user_data['first_name'],
+                    last_name=user_data['last_name'],
+                    password=hashed_password,
+                )
+                for user_data in test_users
+                if user_data['email'] not in existing_emails
+            ])
+            users = {user.email: user for user in User.objects.filter(email__in=emails)}
+
+            # Newly created users have no memberships yet, so their group
+            # assignments can go through the m2m through table in one batch
+            membership_model = User.groups.through
+            membership_model.objects.bulk_create([
+                membership_model(
+                    customuser_id=users[user_data['email']].pk,
+                    group_id=user_data['group'].pk,
+                )
+                for user_data in test_users
+                if user_data['email'] not in existing_emails
+            ], ignore_conflicts=True)
+
         for user_data in test_users:
             email = user_data['email']
-            group = user_data.pop('group')
-            
-            # Create or get user
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults=user_data
-            )
-            
-            if created:
-                user.set_password(user_data['password'])
-                user.save()
-                self.stdout.write(
-                    self.style.SUCCESS(f'Created user: {email}')
+            group = user_data['group']
+
+            if email not in existing_emails:
+                write(
+                    success(f'Created user: {email}')
                 )
-            else:
-                self.stdout.write(
-                    self.style.WARNING(f'User {email} already exists')
+                write(
+                    success(f'Added {email} to {group.name} group')
                 )
-            
-            # Add user to group
-            if group not in user.groups.all():
+                continue
+
+            write(
+                warning(f'User {email} already exists')
+            )
+
+            # Add existing user to group if not already a member; exists()
+            # is a single SELECT 1 ... LIMIT 1 instead of loading all of the
+            # user's groups into memory
+            user = users[email]
+            if not user.groups.filter(pk=group.pk).exists():
                 user.groups.add(group)
-                self.stdout.write(
-                    self.style.SUCCESS(f'Added {email} to {group.name} group')
+                write(
+                    success(f'Added {email} to {group.name} group')
                 )
             else:
-                self.stdout.write(
-                    self.style.WARNING(f'{email} is already in {group.name} group')
+                write(
+                    warning(f'{email} is already in {group.name} group')
                 )
 
-        self.stdout.write(
-            self.style.SUCCESS('\nTest users created successfully!')
+        write(
+            success('\nTest users created successfully!')
         )
-        self.stdout.write('Login credentials:')
-        self.stdout.write('  viewer@test.com / testpass123 (Viewers group)')
-        self.stdout.write('  editor@test.com / testpass123 (Editors group)')
-        self.stdout.write('  admin@test.com / testpass123 (Admins group)')
\ No newline at end of file
+        write('Login credentials:')
+        write('  viewer@test.com / testpass123 (Viewers group)')
+        write('  editor@test.com / testpass123 (Editors group)')
+        write('  admin@test.com / testpass123 (Admins group)')
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from bookshelf.models import Book
 
 
@@ -8,60 +9,81 @@ class Command(BaseCommand):
     help = 'Create user groups and assign permissions'
 
     def handle(self, *args, **options):
+        # Bind the output helpers once instead of re-resolving the
+        # attribute chain on every write
+        write = self.stdout.write
+        success = self.style.SUCCESS
+        warning = self.style.WARNING
+
         # Get the Book content type
         book_content_type = ContentType.objects.get_for_model(Book)
-        
-        # Get or create permissions
-        can_view, created = Permission.objects.get_or_create(
-            codename='can_view',
-            name='Can view book',
-            content_type=book_content_type,
-        )
-        can_create, created = Permission.objects.get_or_create(
-            codename='can_create',
-            name='Can create book',
-            content_type=book_content_type,
-        )
-        can_edit, created = Permission.objects.get_or_create(
-            codename='can_edit',
-            name='Can edit book',
-            content_type=book_content_type,
-        )
-        can_delete, created = Permission.objects.get_or_create(
-            codename='can_delete',
-            name='Can delete book',
-            content_type=book_content_type,
-        )
 
-        # Create groups and assign permissions
-        
-        # Viewers group - can only view books
-        viewers_group, created = Group.objects.get_or_create(name='Viewers')
-        viewers_group.permissions.set([can_view])
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created Viewers group'))
-        else:
-            self.stdout.write(self.style.WARNING('Viewers group already exists, updated permissions'))
+        permission_defs = [
+            ('can_view', 'Can view book'),
+            ('can_create', 'Can create book'),
+            ('can_edit', 'Can edit book'),
+            ('can_delete', 'Can delete book'),
+        ]
+        codenames = [codename for codename, _ in permission_defs]
+        group_names = ['Viewers', 'Editors', 'Admins']
+
+        with transaction.atomic():
+            # Fetch existing permissions in one query and bulk-create the
+            # missing ones, instead of a get_or_create round-trip each.
+            # codename is only unique together with content_type, so build
+            # the map by hand rather than with in_bulk(field_name=...)
+            permissions = {
+                permission.codename: permission
+                for permission in Permission.objects.filter(
+                    content_type=book_content_type,
+                    codename__in=codenames,
+                )
+            }
+
+            missing_permissions = [
+                Permission(codename=codename, name=name, content_type=book_content_type)
+                for codename, name in permission_defs
+                if codename not in permissions
+            ]
+            if missing_permissions:
+                Permission.objects.bulk_create(missing_permissions, ignore_conflicts=True)
+                permissions = {
+                    permission.codename: permission
+                    for permission in Permission.objects.filter(
+                        content_type=book_content_type,
+                        codename__in=codenames,
+                    )
+                }
+
+            # Same pattern for the groups: one SELECT, one bulk INSERT
+            existing_group_names = set(
+                Group.objects.filter(name__in=group_names).values_list('name', flat=True)
+            )
+            Group.objects.bulk_create(
+                [Group(name=name) for name in group_names if name not in existing_group_names],
+                ignore_conflicts=True,
+            )
+            groups = {group.name: group for group in Group.objects.filter(name__in=group_names)}
 
-        # Editors group - can view, create, and edit books
-        editors_group, created = Group.objects.get_or_create(name='Editors')
-        editors_group.permissions.set([can_view, can_create, can_edit])
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created Editors group'))
-        else:
-            self.stdout.write(self.style.WARNING('Editors group already exists, updated permissions'))
+            # Assign permissions per group (one query pair each, fine at 3 groups)
+            group_permissions = {
+                'Viewers': [permissions['can_view']],
+                'Editors': [permissions['can_view'], permissions['can_create'], permissions['can_edit']],
+                'Admins': [permissions['can_view'], permissions['can_create'],
+                           permissions['can_edit'], permissions['can_delete']],
+            }
+            for name in group_names:
+                groups[name].permissions.set(group_permissions[name])
 
-        # Admins group - can perform all actions on books
-        admins_group, created = Group.objects.get_or_create(name='Admins')
-        admins_group.permissions.set([can_view, can_create, can_edit, can_delete])
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created Admins group'))
-        else:
-            self.stdout.write(self.style.WARNING('Admins group already exists, updated permissions'))
+        for name in group_names:
+            if name in existing_group_names:
+                write(warning(f'{name} group already exists, updated permissions'))
+            else:
+                write(success(f'Created {name} group'))
 
-        self.stdout.write(
-            self.style.SUCCESS('Successfully configured groups and permissions:')
+        write(
+            success('Successfully configured groups and permissions:')
         )
-        self.stdout.write('  - Viewers: can_view')
-        self.stdout.write('  - Editors: can_view, can_create, can_edit')
-        self.stdout.write('  - Admins: can_view, can_create, can_edit, can_delete')
\ No newline at end of file
+        write('  - Viewers: can_view')
+        write('  - Editors: can_view, can_create, can_edit')
+        write('  - Admins: can_view, can_create, can_edit, can_delete')
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-08-30 10:55
+
+from django.db import migrations, models
+
+
+def copy_roles_from_profiles(apps, schema_editor):
+    """Copy existing UserProfile roles onto the denormalized field."""
+    UserProfile = apps.get_model('relationship_app', 'UserProfile')
+    CustomUser = apps.get_model('bookshelf', 'CustomUser')
+    for profile in UserProfile.objects.all().iterator():
+        CustomUser.objects.filter(pk=profile.user_id).update(role=profile.role)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookshelf', '0004_book_updated_at'),
+        ('relationship_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='role',
+            field=models.CharField(choices=[('Admin', 'Admin'), ('Librarian', 'Librarian'), ('Member', 'Member')], db_index=True, default='Member', max_length=20, verbose_name='Role'),
+        ),
+        migrations.RunPython(copy_roles_from_profiles, migrations.RunPython.noop),
+    ]
@@ -44,6 +44,16 @@ class CustomUser(AbstractUser):
     date_of_birth = models.DateField('Date of Birth', null=True, blank=True)
     profile_photo = models.FileField('Profile Photo', upload_to='profile_photos/', null=True, blank=True)
     
+    # Role for relationship_app's role-based views, denormalized from
+    # UserProfile so role checks read the row already fetched for
+    # authentication instead of joining the profile table
+    ROLE_CHOICES = [
+        ('Admin', 'Admin'),
+        ('Librarian', 'Librarian'),
+        ('Member', 'Member'),
+    ]
+    role = models.CharField('Role', max_length=20, choices=ROLE_CHOICES, default='Member', db_index=True)
+    
     # Use email as the unique identifier
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name', 'last_name']
@@ -74,17 +84,29 @@ class CustomUser(AbstractUser):
     @property
     def age(self):
         """Calculate and return the user's age based on date_of_birth."""
+        return self.age_on(timezone.localdate())
+
+    def age_on(self, today):
+        """Return the user's age on the given date.
+
+        Callers rendering many users (e.g. an admin changelist) can compute
+        the date once and pass it in, instead of paying for a timezone
+        lookup and date construction per row.
+        """
         if self.date_of_birth:
-            today = timezone.now().date()
             return today.year - self.date_of_birth.year - ((today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day))
         return None
 
 # Create your models here.
 
 class Book(models.Model):
-    title = models.CharField(max_length=200)
-    author = models.CharField(max_length=100)
+    # Indexed for admin search and the title lookups in the management
+    # commands (email on CustomUser is unique and therefore already indexed)
+    title = models.CharField(max_length=200, db_index=True)
+    author = models.CharField(max_length=100, db_index=True)
     publication_year = models.IntegerField()
+    # Tracks the last modification, used for conditional GET (ETag) handling
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         permissions = [
@@ -1,15 +1,19 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.contrib.auth.decorators import permission_required, login_required
-from django.http import HttpResponseForbidden
+from django.contrib.auth.decorators import permission_required
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_cookie
+from django.http import HttpResponseForbidden, Http404
 from django.contrib import messages
-from django.utils.html import escape
+from django.utils.text import format_lazy
 from .models import Book
 from .forms import BookForm
 from .forms import ExampleForm
 
 
 @permission_required('bookshelf.can_view', raise_exception=True)
-@login_required
+@cache_page(60)
+@vary_on_cookie
 def book_list(request):
     """
     Display list of all books - requires can_view permission.
@@ -26,8 +30,14 @@ def book_list(request):
     })
 
 
+def _book_etag(request, pk):
+    """ETag for book_detail: one cheap SELECT of the update timestamp."""
+    updated_at = Book.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    return str(updated_at) if updated_at else None
+
+
 @permission_required('bookshelf.can_view', raise_exception=True)
-@login_required
+@condition(etag_func=_book_etag)
 def book_detail(request, pk):
     """Display book details - requires can_view permission."""
     book = get_object_or_404(Book, pk=pk)
@@ -38,7 +48,6 @@ def book_detail(request, pk):
 
 
 @permission_required('bookshelf.can_create', raise_exception=True)
-@login_required
 def book_create(request):
     """
     Create a new book - requires can_create permission.
@@ -53,8 +62,9 @@ def book_create(request):
         form = BookForm(request.POST)  # Form includes CSRF protection
         if form.is_valid():  # Validates and sanitizes all input
             book = form.save()
-            # Escape output in success message to prevent XSS
-            messages.success(request, f'Book "{escape(book.title)}" created successfully!')
+            # Lazy formatting: the string is only built if the message is
+            # rendered, and template auto-escaping handles the title then
+            messages.success(request, format_lazy('Book "{}" created successfully!', book.title))
             return redirect('book_detail', pk=book.pk)
     else:
         form = BookForm()
@@ -67,7 +77,6 @@ def book_create(request):
 
 
 @permission_required('bookshelf.can_edit', raise_exception=True)
-@login_required
 def book_edit(request, pk):
     """Edit an existing book - requires can_edit permission."""
     book = get_object_or_404(Book, pk=pk)
@@ -76,7 +85,7 @@ def book_edit(request, pk):
         form = BookForm(request.POST, instance=book)
         if form.is_valid():
             book = form.save()
-            messages.success(request, f'Book "{book.title}" updated successfully!')
+            messages.success(request, format_lazy('Book "{}" updated successfully!', book.title))
             return redirect('book_detail', pk=book.pk)
     else:
         form = BookForm(instance=book)
@@ -90,17 +99,20 @@ def book_edit(request, pk):
 
 
 @permission_required('bookshelf.can_delete', raise_exception=True)
-@login_required
 def book_delete(request, pk):
     """Delete a book - requires can_delete permission."""
-    book = get_object_or_404(Book, pk=pk)
-    
     if request.method == 'POST':
-        title = book.title
-        book.delete()
-        messages.success(request, f'Book "{title}" deleted successfully!')
+        # The POST path only needs the title for the success message, so
+        # fetch that single column and delete by pk instead of
+        # instantiating the full model
+        title = Book.objects.filter(pk=pk).values_list('title', flat=True).first()
+        if title is None:
+            raise Http404('No Book matches the given query.')
+        Book.objects.filter(pk=pk).delete()
+        messages.success(request, format_lazy('Book "{}" deleted successfully!', title))
         return redirect('book_list')
     
+    book = get_object_or_404(Book, pk=pk)
     return render(request, 'bookshelf/book_confirm_delete.html', {
         'book': book,
         'user': request.user
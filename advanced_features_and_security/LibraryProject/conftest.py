@@ -0,0 +1,22 @@
+"""
+Shared Django bootstrap for the test scripts in this directory.
+
+test_https_security.py and test_security.py each ran the same
+sys.path/DJANGO_SETTINGS_MODULE/django.setup() preamble at import time,
+so loading both in one process paid for app-registry population twice.
+Importing this module instead configures Django exactly once; the
+apps.ready guard makes every later import a no-op. pytest also picks the
+file up automatically as a conftest.
+"""
+
+import os
+import sys
+
+import django
+from django.apps import apps
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'LibraryProject.settings')
+
+if not apps.ready:
+    django.setup()
@@ -7,6 +7,14 @@ import sys
 def main():
     """Run administrative tasks."""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'LibraryProject.settings')
+    # Default the test command to a parallel run that reuses the test
+    # database between invocations; either flag can still be overridden
+    # explicitly on the command line.
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        if not any(arg.startswith('--parallel') for arg in sys.argv):
+            sys.argv.append('--parallel=auto')
+        if '--keepdb' not in sys.argv:
+            sys.argv.append('--keepdb')
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
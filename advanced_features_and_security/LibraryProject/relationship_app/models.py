@@ -58,3 +58,15 @@ def create_user_profile(sender, instance, created, **kwargs):
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, **kwargs):
     instance.userprofile.save()
+
+@receiver(post_save, sender=UserProfile)
+def sync_user_role(sender, instance, **kwargs):
+    """Write the profile's role through to the denormalized user.role.
+
+    Roles are still assigned on UserProfile; this keeps the copy the
+    role-check views read from going stale. The queryset update skips the
+    user's post_save signals, so saving a profile can't recurse back here.
+    """
+    if instance.user.role != instance.role:
+        User.objects.filter(pk=instance.user_id).update(role=instance.role)
+        instance.user.role = instance.role
@@ -1,13 +1,17 @@
-from .views import list_books, RegisterView
 from django.urls import path
 from . import views
 from django.contrib.auth.views import LoginView, LogoutView
 
+# Build the auth views once at import time so reloading the URLconf does
+# not call as_view() again
+login_view = LoginView.as_view(template_name='relationship_app/login.html')
+logout_view = LogoutView.as_view(template_name='relationship_app/logout.html')
+
 urlpatterns = [
     path('books/', views.list_books, name='list_books'),
     path('library/<int:pk>/', views.LibraryDetailView.as_view(), name='library_detail'),
-    path('login/', LoginView.as_view(template_name='relationship_app/login.html'), name='login'),
-    path('logout/', LogoutView.as_view(template_name='relationship_app/logout.html'), name='logout'),
+    path('login/', login_view, name='login'),
+    path('logout/', logout_view, name='logout'),
     path('register/', views.register, name='register'),
     path('admin-view/', views.admin_view, name='admin_view'),
     path('librarian-view/', views.librarian_view, name='librarian_view'),
@@ -15,4 +19,4 @@ urlpatterns = [
     path('add_book/', views.add_book, name='add_book'),
     path('edit_book/<int:pk>/', views.edit_book, name='edit_book'),
     path('delete_book/<int:pk>/', views.delete_book, name='delete_book'),
-] 
\ No newline at end of file
+]
\ No newline at end of file
@@ -16,6 +16,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'LibraryProject.settings')
 django.setup()
 
+from django.conf import settings
+
+# PBKDF2 hashing dominates this script's runtime (hundreds of ms per user).
+# The test users never need production-grade hashes, so use the fast MD5
+# hasher for this script only.
+settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 from bookshelf.models import CustomUser
 
 def test_custom_user_creation():
@@ -3,43 +3,33 @@ Security tests for the Django Library Project.
 Tests various security configurations and protections.
 """
 
-import os
-import sys
-import django
-from django.conf import settings
-
-# Configure Django first
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'LibraryProject.settings')
-django.setup()
+# Configure Django once per process (shared with the other test modules)
+import conftest  # noqa: F401
 
 # Now import Django modules
-from django.test import TestCase, Client
+from django.test import SimpleTestCase, TestCase, Client
 from django.contrib.auth.models import User
 from django.urls import reverse
 from bookshelf.models import Book, CustomUser
 from bookshelf.forms import BookForm
 
+# Malicious inputs exercised against the book form
+_MALICIOUS_INPUTS = (
+    '<script>alert("xss")</script>',
+    'javascript:alert("xss")',
+    '<img src="x" onerror="alert(1)">',
+    'data:text/html,<script>alert(1)</script>',
+)
+
+
+class SecurityTestCase(SimpleTestCase):
+    """Test security protections that never touch the database.
+
+    The header and form-validation tests don't read or write any rows, so
+    they run as SimpleTestCase and skip the per-test fixture INSERTs and
+    transaction rollback entirely.
+    """
 
-class SecurityTestCase(TestCase):
-    """Test security configurations and protections."""
-    
-    def setUp(self):
-        """Set up test data."""
-        self.client = Client()
-        # Create test user with required fields for CustomUser
-        self.user = CustomUser.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            date_of_birth='1990-01-01'
-        )
-        self.book = Book.objects.create(
-            title='Test Book',
-            author='Test Author',
-            publication_year=2023
-        )
-    
     def test_security_headers(self):
         """Test that security headers are present in responses."""
         response = self.client.get('/')
@@ -62,26 +52,23 @@ class SecurityTestCase(TestCase):
     
     def test_form_validation_xss_protection(self):
         """Test that form validation prevents XSS attacks."""
-        # Test malicious input in book form
-        malicious_inputs = [
-            '<script>alert("xss")</script>',
-            'javascript:alert("xss")',
-            '<img src="x" onerror="alert(1)">',
-            'data:text/html,<script>alert(1)</script>'
-        ]
-        
-        for malicious_input in malicious_inputs:
-            form_data = {
-                'title': malicious_input,
-                'author': 'Test Author',
-                'publication_year': 2023
-            }
-            form = BookForm(data=form_data)
-            
-            # Form should be invalid due to security validation
-            self.assertFalse(form.is_valid(), f"Form accepted malicious input: {malicious_input}")
-            if 'title' in form.errors:
-                print(f"[PASS] XSS protection blocked: {malicious_input}")
+        # Bind the form class locally and reuse one data dict; only the
+        # title changes between iterations
+        BF = BookForm
+        form_data = {
+            'author': 'Test Author',
+            'publication_year': 2023
+        }
+        for malicious_input in _MALICIOUS_INPUTS:
+            # subTest keeps the remaining inputs running when one fails
+            with self.subTest(malicious_input=malicious_input):
+                form_data['title'] = malicious_input
+                form = BF(data=form_data)
+
+                # Form should be invalid due to security validation
+                self.assertFalse(form.is_valid(), f"Form accepted malicious input: {malicious_input}")
+                if 'title' in form.errors:
+                    print(f"[PASS] XSS protection blocked: {malicious_input}")
     
     def test_input_sanitization(self):
         """Test that inputs are properly sanitized."""
@@ -99,13 +86,36 @@ class SecurityTestCase(TestCase):
             print("[PASS] HTML tags properly stripped from input")
         else:
             print("[FAIL] Form validation errors:", form.errors)
-    
+
+
+class SecurityCsrfTestCase(TestCase):
+    """Test CSRF protection, which needs a logged-in user in the database."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared test data once for the whole class.
+
+        setUpTestData runs a single INSERT per class instead of one per
+        test method; each test still sees a clean copy via the per-test
+        transaction rollback.
+        """
+        # CustomUser drops the username field and authenticates by email
+        cls.user = CustomUser.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            date_of_birth='1990-01-01'
+        )
+
+    def setUp(self):
+        """Set up per-test state (the client is cheap to build per test)."""
+        self.client = Client()
+
     def test_csrf_protection(self):
         """Test CSRF protection on forms."""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.login(username='test@example.com', password='testpass123')
         
         # Try to submit form without CSRF token (should fail)
-        response = self.client.post('/bookshelf/create/', {
+        response = self.client.post(reverse('book_create'), {
             'title': 'Test Title',
             'author': 'Test Author', 
             'publication_year': 2023
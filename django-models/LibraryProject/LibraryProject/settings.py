@@ -68,6 +68,20 @@ TEMPLATES = [
     },
 ]
 
+# Template caching for production
+# With the cached loader each template is parsed once per process instead of
+# being re-read and re-parsed (with the filesystem stat calls that implies)
+# on every render. Only enabled when DEBUG is off so templates still
+# auto-reload during development.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'LibraryProject.wsgi.application'
 
 
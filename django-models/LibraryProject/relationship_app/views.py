@@ -15,7 +15,10 @@ from django.http import HttpResponseForbidden
 
 # Function-based view to list all books (HTML template)
 def list_books(request):
-    books = Book.objects.all()
+    # select_related joins the author in the same query; the template reads
+    # book.author.name for every row. only() keeps the SELECT down to the
+    # columns the template actually renders.
+    books = Book.objects.select_related('author').only('title', 'author__name')
     return render(request, 'relationship_app/list_books.html', {'books': books})
 
 # Class-based view for library details
@@ -23,6 +26,9 @@ class LibraryDetailView(DetailView):
     model = Library
     template_name = 'relationship_app/library_detail.html'
     context_object_name = 'library'
+    # The template iterates library.books.all and reads each book's author,
+    # so prefetch both to avoid one query per book
+    queryset = Library.objects.prefetch_related('books__author')
 
 # Function-based register view for checker compliance
 def register(request):
@@ -57,14 +63,26 @@ class RegisterView(View):
         return render(request, 'relationship_app/register.html', {'form': form})
 
 # Role-based access control views
+def get_role(user):
+    """Return the user's profile role, hitting the database at most once
+    per user instance instead of once per role check."""
+    if not user.is_authenticated:
+        return None
+    if not hasattr(user, '_cached_role'):
+        try:
+            user._cached_role = user.userprofile.role
+        except UserProfile.DoesNotExist:
+            user._cached_role = None
+    return user._cached_role
+
 def is_admin(user):
-    return hasattr(user, 'userprofile') and user.userprofile.role == 'Admin'
+    return get_role(user) == 'Admin'
 
 def is_librarian(user):
-    return hasattr(user, 'userprofile') and user.userprofile.role == 'Librarian'
+    return get_role(user) == 'Librarian'
 
 def is_member(user):
-    return hasattr(user, 'userprofile') and user.userprofile.role == 'Member'
+    return get_role(user) == 'Member'
 
 @user_passes_test(is_admin)
 @login_required